@@ -8,7 +8,9 @@ r"""
 Submodule import policy
 +++++++++++++++++++++++
 
-The following submodules are auto-imported when the root module ``pyuavcan`` is imported:
+The following submodules are auto-imported on first access as attributes of the root module ``pyuavcan``
+(e.g., ``import pyuavcan; pyuavcan.transport``);
+they are not imported eagerly with the root module in order to reduce the startup time of short-lived processes:
 
 - :mod:`pyuavcan.dsdl`
 
@@ -45,10 +47,24 @@ the library log level:
 - ``DEBUG``
 
 If not set, the log level is determined following the regular policies of the Python's standard ``logging`` library.
+
+
+Event loop override
++++++++++++++++++++
+
+The library works with any :mod:`asyncio` event loop implementation.
+The stock event loop may become a bottleneck at high message rates; the third-party package ``uvloop``
+provides a faster drop-in replacement, which can be enabled by invoking :func:`use_uvloop`
+before the event loop is created.
+Alternatively, the environment variable ``PYUAVCAN_USE_UVLOOP`` can be set to ``1``
+to have it enabled automatically when the root module is imported.
+If the package is not installed, a warning is logged and the default event loop is used.
 """
 
 import os as _os
 import sys as _sys
+import typing as _typing
+import importlib as _importlib
 
 
 with open(_os.path.join(_os.path.dirname(__file__), 'VERSION')) as _version:
@@ -80,8 +96,40 @@ if _log_level_from_env is not None:
     _logging.getLogger(__name__).info('Log config from env var; level: %r', _log_level_from_env)
 
 
-# The sub-packages are imported in the order of their interdependency.
-import pyuavcan.util as util                    # noqa
-import pyuavcan.dsdl as dsdl                    # noqa
-import pyuavcan.transport as transport          # noqa
-import pyuavcan.presentation as presentation    # noqa
+def use_uvloop() -> bool:
+    """
+    Installs the event loop policy provided by ``uvloop``, which affects the event loops created afterwards.
+    Returns True on success. If ``uvloop`` is not installed, a warning is logged and False is returned.
+    """
+    import logging
+    try:
+        import uvloop
+    except ImportError:
+        logging.getLogger(__name__).warning('Could not import uvloop; the default event loop will be used')
+        return False
+    uvloop.install()
+    logging.getLogger(__name__).info('Using uvloop %s', getattr(uvloop, '__version__', '(unknown version)'))
+    return True
+
+
+if _os.environ.get('PYUAVCAN_USE_UVLOOP') == '1':
+    use_uvloop()
+
+
+# The sub-packages are imported lazily upon first access (PEP 562).
+_LAZY_SUBMODULES = {'util', 'dsdl', 'transport', 'presentation'}
+
+__all__ = ['UAVCAN_SPECIFICATION_VERSION', 'use_uvloop', *sorted(_LAZY_SUBMODULES)]
+
+if _typing.TYPE_CHECKING:  # pragma: no cover
+    import pyuavcan.util as util                    # noqa
+    import pyuavcan.dsdl as dsdl                    # noqa
+    import pyuavcan.transport as transport          # noqa
+    import pyuavcan.presentation as presentation    # noqa
+
+
+def __getattr__(name: str) -> _typing.Any:
+    if name in _LAZY_SUBMODULES:
+        # The import machinery will also store the submodule in the globals, so this function is invoked only once.
+        return _importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -340,10 +340,14 @@ class ZeroExtendingBuffer:
     A read beyond the end of the buffer returns zero bytes.
     """
     def __init__(self, fragmented_buffer: typing.Sequence[memoryview]):
-        # TODO: Concatenation is a tentative measure. Add proper support for fragmented buffers for speed.
+        if len(fragmented_buffer) > 1:
+            # Empty fragments carry no data; dropping them allows more buffers to take the zero-copy path below.
+            fragmented_buffer = [x for x in fragmented_buffer if len(x) > 0]
         if len(fragmented_buffer) == 1:
-            contiguous: typing.Union[bytearray, memoryview] = fragmented_buffer[0]  # Fast path.
+            contiguous: typing.Union[bytearray, memoryview] = fragmented_buffer[0]  # Fast path, zero-copy.
         else:
+            # This is the only copy made on the way from the transport to the deserialized object.
+            # The buffer cannot be preallocated and reused because the deserialized arrays may refer to its memory.
             contiguous = bytearray().join(fragmented_buffer)
 
         self._buf = numpy.frombuffer(contiguous, dtype=_Byte)
@@ -537,3 +541,18 @@ def _unittest_deserializer_unaligned() -> None:
     assert des.remaining_bit_length == 0
 
     print('repr(deserializer):', repr(des))
+
+
+def _unittest_zero_extending_buffer() -> None:
+    source = bytearray(b'\x01\x02\x03')
+    zeb = ZeroExtendingBuffer([memoryview(b''), memoryview(source), memoryview(b'')])
+    source[0] = 0xFF        # The empty fragments are ignored, so the source memory is referenced directly.
+    assert zeb.get_byte(0) == 0xFF
+    assert zeb.bit_length == 24
+
+    zeb = ZeroExtendingBuffer([memoryview(source), memoryview(b''), memoryview(b'\x04')])
+    source[0] = 0x01        # The fragments are concatenated, so the change is not visible.
+    assert [zeb.get_byte(i) for i in range(5)] == [0xFF, 0x02, 0x03, 0x04, 0x00]
+
+    assert ZeroExtendingBuffer([]).bit_length == 0
+    assert ZeroExtendingBuffer([memoryview(b''), memoryview(b'')]).bit_length == 0
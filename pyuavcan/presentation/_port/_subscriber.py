@@ -8,7 +8,9 @@ from __future__ import annotations
 import typing
 import logging
 import asyncio
+import weakref
 import dataclasses
+import concurrent.futures
 import pyuavcan.util
 import pyuavcan.dsdl
 import pyuavcan.transport
@@ -19,6 +21,13 @@ from ._error import PortClosedError
 # Shouldn't be too large as this value defines how quickly the task will detect that the underlying transport is closed.
 _RECEIVE_TIMEOUT = 1
 
+# The listener ring buffer starts at this size and is doubled as necessary up to the queue capacity limit, if any.
+_INITIAL_QUEUE_SIZE = 16
+
+# Transfers carrying more payload than this are deserialized in a worker thread to avoid blocking the event loop.
+# Smaller transfers are deserialized in the task directly because the thread handoff would cost more than it saves.
+_OFFLOADED_DESERIALIZATION_THRESHOLD = 64 * 1024
+
 
 _logger = logging.getLogger(__name__)
 
@@ -29,6 +38,8 @@ ReceivedMessageHandler = typing.Callable[[MessageClass, pyuavcan.transport.Trans
 
 @dataclasses.dataclass
 class SubscriberStatistics:
+    __slots__ = ('transport_session', 'messages', 'overruns', 'deserialization_failures')
+
     transport_session:        pyuavcan.transport.SessionStatistics  #: Shared per session specifier.
     messages:                 int  #: Number of received messages, individual per subscriber.
     overruns:                 int  #: Number of messages lost to queue overruns; individual per subscriber.
@@ -46,12 +57,12 @@ class Subscriber(MessagePort[MessageClass]):
     the application should either avoid mutating received message objects or clone them beforehand.
 
     This class implements the async iterator protocol yielding received messages.
-    Iteration stops shortly after the subscriber is closed.
+    Iteration stops as soon as the subscriber is closed.
     It can be used as follows::
 
         async for message, transfer in subscriber:
             ...  # Handle the message.
-        # The loop will be stopped shortly after the subscriber is closed.
+        # The loop will be stopped when the subscriber is closed.
 
     Implementation info: all subscribers sharing the same session specifier also share the same
     underlying implementation object containing the transport session which is reference counted and destroyed
@@ -65,18 +76,17 @@ class Subscriber(MessagePort[MessageClass]):
         """
         Do not call this directly! Use :meth:`Presentation.make_subscriber`.
         """
-        if queue_capacity is None:
-            queue_capacity = 0      # This case is defined by the Queue API. Means unlimited.
-        else:
+        if queue_capacity is not None:
             queue_capacity = int(queue_capacity)
             if queue_capacity < 1:
                 raise ValueError(f'Invalid queue capacity: {queue_capacity}')
 
         self._closed = False
         self._impl = impl
+        self._dtype = impl.dtype
         self._loop = loop
         self._maybe_task: typing.Optional[asyncio.Task[None]] = None
-        self._rx: _Listener[MessageClass] = _Listener(asyncio.Queue(maxsize=queue_capacity, loop=loop))
+        self._rx: _Listener[MessageClass] = _Listener(queue_capacity, loop, owner=self)
         impl.add_listener(self._rx)
 
     # ----------------------------------------  HANDLER-BASED API  ----------------------------------------
@@ -94,19 +104,47 @@ class Subscriber(MessagePort[MessageClass]):
 
         This method of handling messages should not be used with the plain async receive API;
         an attempt to do so may lead to unpredictable message distribution between consumers.
+
+        If this subscriber is the only one for its subject and there are no queued messages pending processing,
+        the queue is bypassed and the handler is invoked directly from the task that reads the transport session.
+        The handler is never invoked concurrently and the messages are always processed in the order of arrival.
+        In this mode, a handler that is slower than the incoming message flow delays the reception instead of
+        filling up the queue, so the messages are buffered by the transport rather than by the subscriber:
+        the queue capacity has no effect and the overrun counter of the subscriber is not incremented.
+        Also, if the handler raises :class:`asyncio.CancelledError`, the reception stops for all subscribers
+        of the subject rather than only for this one.
         """
         async def task_function() -> None:
-            # This could be an interesting opportunity for optimization: instead of using the queue, just let the
-            # implementation class invoke the handler from its own receive task directly. Eliminates extra indirection.
+            # The implementation may also invoke the handler directly bypassing the queue if this subscriber is the only
+            # one for its session specifier, but only when this task is idle; see the listener class for details.
             while not self._closed:
                 try:
-                    message, transfer = await self.receive()
+                    # Process all messages that are already queued at once to avoid waiting for every one of them.
+                    # The messages and the transfers are kept in separate lists to avoid constructing a tuple per
+                    # message; zip() reuses its output tuple when it is unpacked immediately.
+                    self._raise_if_closed_or_failed()
+                    messages, transfers = self._rx.drain()
+                    if not messages:
+                        message, transfer = await self.receive()
+                        messages, transfers = [message], [transfer]
+                    # There shall be no context switch between the reception of the batch and this point.
+                    self._rx.busy = True
+                    taken = 0
                     try:
-                        await handler(message, transfer)
-                    except asyncio.CancelledError:
-                        raise
-                    except Exception as ex:
-                        _logger.exception('%s got an unhandled exception in the message handler: %s', self, ex)
+                        for message, transfer in zip(messages, transfers):
+                            taken += 1
+                            try:
+                                await handler(message, transfer)
+                            except asyncio.CancelledError:
+                                raise
+                            except Exception as ex:
+                                _logger.exception('%s got an unhandled exception in the message handler: %s', self, ex)
+                    finally:
+                        self._rx.busy = False
+                        # If the task is cancelled midway (e.g., the handler is being replaced), the rest of the batch
+                        # is returned into the queue so that the messages are not lost.
+                        if taken < len(messages):
+                            self._rx.unshift(messages[taken:], transfers[taken:])
                 except asyncio.CancelledError:
                     _logger.debug('%s receive task cancelled', self)
                     break
@@ -120,6 +158,7 @@ class Subscriber(MessagePort[MessageClass]):
         if self._maybe_task is not None:
             self._maybe_task.cancel()
 
+        self._rx.handler = handler
         self._maybe_task = self._loop.create_task(task_function())
 
     # ----------------------------------------  DIRECT RECEIVE  ----------------------------------------
@@ -129,7 +168,7 @@ class Subscriber(MessagePort[MessageClass]):
         This is like :meth:`receive_for` with an infinite timeout.
         """
         while True:
-            out = await self.receive_for(_RECEIVE_TIMEOUT)
+            out = await self._receive(None)
             if out is not None:
                 return out
 
@@ -156,20 +195,15 @@ class Subscriber(MessagePort[MessageClass]):
         if there is, it will be returned, otherwise None will be returned immediately.
         It is guaranteed that no context switch will occur if the timeout is negative, as if the method was not async.
         """
+        return await self._receive(timeout)
+
+    async def _receive(self, timeout: typing.Optional[float]) \
+            -> typing.Optional[typing.Tuple[MessageClass, pyuavcan.transport.TransferFrom]]:
         self._raise_if_closed_or_failed()
-        try:
-            if timeout > 0:
-                message, transfer = await asyncio.wait_for(self._rx.queue.get(), timeout, loop=self._loop)
-            else:
-                message, transfer = self._rx.queue.get_nowait()
-        except asyncio.QueueEmpty:
-            return None
-        except asyncio.TimeoutError:
-            return None
-        else:
-            assert isinstance(message, self._impl.dtype), 'Internal protocol violation'
-            assert isinstance(transfer, pyuavcan.transport.TransferFrom), 'Internal protocol violation'
-            return message, transfer
+        out = await self._rx.pop(timeout)
+        if out is None:
+            self._raise_if_closed_or_failed()   # The listener is woken up early if we are closed or failed.
+        return out
 
     # ----------------------------------------  ITERATOR API  ----------------------------------------
 
@@ -183,6 +217,8 @@ class Subscriber(MessagePort[MessageClass]):
         """
         This is just a wrapper over :meth:`receive`.
         """
+        if self._closed:    # Fast exit without entering the exception handling path.
+            raise StopAsyncIteration
         try:
             return await self.receive()
         except pyuavcan.transport.ResourceClosedError:
@@ -192,7 +228,7 @@ class Subscriber(MessagePort[MessageClass]):
 
     @property
     def dtype(self) -> typing.Type[MessageClass]:
-        return self._impl.dtype
+        return self._dtype
 
     @property
     def transport_session(self) -> pyuavcan.transport.InputSession:
@@ -212,6 +248,7 @@ class Subscriber(MessagePort[MessageClass]):
         if not self._closed:
             self._closed = True
             self._impl.remove_listener(self._rx)
+            self._rx.close()                    # Unblock the pending receive calls, if any.
             if self._maybe_task is not None:    # The task may be holding the lock.
                 try:
                     self._maybe_task.cancel()   # We don't wait for it to exit because it's pointless.
@@ -234,25 +271,241 @@ class Subscriber(MessagePort[MessageClass]):
             self._impl.remove_listener(self._rx)
 
 
-@dataclasses.dataclass
 class _Listener(typing.Generic[MessageClass]):
     """
-    The queue-induced extra level of indirection adds processing overhead and latency. In the future we may need to
-    consider an optimization where the subscriber would automatically detect whether the underlying implementation
-    is shared among many subscribers or not. If not, it should bypass the queue and read from the transport directly
-    instead. This would avoid the unnecessary overheads and at the same time would be transparent for the user.
+    The queue-induced extra level of indirection adds processing overhead and latency. To avoid that, if the handler
+    is set and the listener is the only one attached to the implementation object, the implementation bypasses
+    the queue and invokes the handler directly from its own task. If the implementation is shared among many
+    subscribers, the queue is used as usual. The queue is also used while it is not empty or while the consumer
+    is busy processing the messages it has already taken from the queue (which is possible if the implementation
+    was shared until recently); otherwise, the handler could be invoked concurrently and out of order.
+
+    There is exactly one producer (the implementation task) and normally one consumer (the owning subscriber)
+    per listener, so instead of the general-purpose :class:`asyncio.Queue` we use a plain ring buffer and wake up
+    the waiting consumer via a bare future. This is considerably cheaper per message.
+    The messages and the transfers are stored in two parallel arrays rather than in an array of tuples to avoid
+    allocating a new tuple per pushed message; the only tuple is constructed when the message is popped.
     """
-    queue:         asyncio.Queue[typing.Tuple[MessageClass, pyuavcan.transport.TransferFrom]]
-    push_count:    int = 0
-    overrun_count: int = 0
-    exception:     typing.Optional[Exception] = None
+    # There may be a great many listeners and their attributes are accessed per message, hence the slots.
+    __slots__ = ('capacity', 'push_count', 'overrun_count', 'exception', 'handler', 'busy', 'closed',
+                 '_loop', '_owner', '_waiters', '_messages', '_transfers', '_head', '_length')
+
+    def __init__(self,
+                 capacity: typing.Optional[int],
+                 loop:     asyncio.AbstractEventLoop,
+                 owner:    typing.Optional[object] = None):
+        """
+        :param capacity: The maximum number of messages in the queue. None means unlimited.
+        :param owner: The subscriber that owns this listener; it is referred to in the log instead of the listener.
+            Only a weak reference is kept because the owner shall remain collectable while the listener is in use.
+        """
+        self.capacity = capacity
+        self.push_count = 0
+        self.overrun_count = 0
+        self.exception: typing.Optional[Exception] = None
+        self.handler: typing.Optional[ReceivedMessageHandler[MessageClass]] = None
+        self.busy = False   # Set by the consumer while it is processing the messages taken from the queue.
+        self.closed = False
+        self._loop = loop
+        self._owner = weakref.ref(owner) if owner is not None else None
+        self._waiters: typing.List[asyncio.Future[None]] = []
+        size = _INITIAL_QUEUE_SIZE if capacity is None else min(_INITIAL_QUEUE_SIZE, capacity)
+        self._messages: typing.List[typing.Optional[MessageClass]] = [None] * size
+        self._transfers: typing.List[typing.Optional[pyuavcan.transport.TransferFrom]] = [None] * size
+        self._head = 0      # Index of the oldest message.
+        self._length = 0    # Number of messages in the queue.
 
     def push(self, message: MessageClass, transfer: pyuavcan.transport.TransferFrom) -> None:
+        size = len(self._messages)
+        if self._length >= size:
+            if self.capacity is not None and size >= self.capacity:
+                self.overrun_count += 1
+                # Sustained overruns are logged at exponentially growing intervals to avoid flooding the log.
+                if self.overrun_count & (self.overrun_count - 1) == 0:
+                    _logger.warning('%r: queue overrun, %d messages lost so far. '
+                                    'The consumer is too slow or the queue capacity is too small.',
+                                    self, self.overrun_count)
+                return
+            self._grow()
+            size = len(self._messages)
+        tail = (self._head + self._length) % size
+        self._messages[tail] = message
+        self._transfers[tail] = transfer
+        self._length += 1
+        self.push_count += 1
+        if self._waiters:
+            self._wake_waiters()
+
+    async def pop(self, timeout: typing.Optional[float]) \
+            -> typing.Optional[typing.Tuple[MessageClass, pyuavcan.transport.TransferFrom]]:
+        """
+        Returns the oldest message from the queue, waiting for the specified time if the queue is empty.
+        None timeout means wait forever. Returns None on timeout or if the listener is closed.
+        If the queue is not empty or the timeout is non-positive, no context switch will occur.
+
+        Concurrent invocations are supported (although the user is advised against that): all of them are woken up
+        when a message is pushed, and those that did not get the message continue waiting.
+        """
+        if self._length or self.closed or (timeout is not None and timeout <= 0):
+            return self._pop_nowait()
+        # A plain timer is much cheaper than asyncio.wait_for(), which creates a new task per call.
+        deadline = self._loop.time() + timeout if timeout is not None else None
+        while True:
+            waiter = self._loop.create_future()
+            timer = self._loop.call_at(deadline, _wake_waiter, waiter) if deadline is not None else None
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                self._waiters.remove(waiter)
+                if timer is not None:
+                    timer.cancel()
+            if self._length or self.closed or (deadline is not None and self._loop.time() >= deadline):
+                return self._pop_nowait()
+
+    def drain(self) -> typing.Tuple[typing.List[MessageClass], typing.List[pyuavcan.transport.TransferFrom]]:
+        """
+        Removes all messages currently in the queue without waiting.
+        Returns the messages and their transfers as two lists of equal length, oldest first.
+        """
+        length = self._length
+        if not length:
+            return [], []
+        size = len(self._messages)
+        head, end = self._head, self._head + length
+        if end <= size:
+            messages, transfers = self._messages[head:end], self._transfers[head:end]
+        else:
+            messages = self._messages[head:] + self._messages[:end - size]
+            transfers = self._transfers[head:] + self._transfers[:end - size]
+        self._length = 0
+        if size > _INITIAL_QUEUE_SIZE and length <= size // 4:
+            self._shrink()
+        else:
+            # Only the drained slots are cleared; reallocating the whole ring per batch would cost O(size).
+            if end <= size:
+                self._messages[head:end] = [None] * length
+                self._transfers[head:end] = [None] * length
+            else:
+                self._messages[head:] = [None] * (size - head)
+                self._transfers[head:] = [None] * (size - head)
+                self._messages[:end - size] = [None] * (end - size)
+                self._transfers[:end - size] = [None] * (end - size)
+            self._head = 0
+        return messages, transfers  # type: ignore
+
+    def unshift(self,
+                messages:  typing.List[MessageClass],
+                transfers: typing.List[pyuavcan.transport.TransferFrom]) -> None:
+        """
+        Returns the messages taken out of the queue earlier (via :meth:`drain`) back to its head, oldest first,
+        as if they were never taken out. The messages that were pushed meanwhile remain after them.
+        If the capacity is exceeded as a result, the newest messages are dropped and counted as overruns.
+        """
+        if not messages:
+            return
+        queued_messages, queued_transfers = self.drain()
+        all_messages: typing.List[typing.Optional[MessageClass]] = [*messages, *queued_messages]
+        all_transfers: typing.List[typing.Optional[pyuavcan.transport.TransferFrom]] = [*transfers, *queued_transfers]
+        length = len(all_messages)
+        if self.capacity is not None and length > self.capacity:
+            lost = length - self.capacity
+            self.overrun_count += lost
+            self.push_count -= lost
+            length = self.capacity
+            del all_messages[length:], all_transfers[length:]
+        size = max(len(self._messages), length)
+        self._messages = all_messages + [None] * (size - length)
+        self._transfers = all_transfers + [None] * (size - length)
+        self._head = 0
+        self._length = length
+        if self._waiters:
+            self._wake_waiters()
+
+    def close(self) -> None:
+        """
+        Unblocks all pending :meth:`pop` immediately; the subsequent invocations will not block.
+        This is done when the owning subscriber is closed and when the implementation has failed.
+        """
+        self.closed = True
+        self._wake_waiters()
+
+    @property
+    def idle(self) -> bool:
+        """
+        True if the queue is empty and the consumer is not processing the messages taken from it earlier.
+        The handler may be invoked directly via :meth:`handle` only if the listener is idle.
+        """
+        return not self._length and not self.busy
+
+    async def handle(self, message: MessageClass, transfer: pyuavcan.transport.TransferFrom) -> None:
+        """
+        Invokes the handler directly bypassing the queue. The handler shall be set and the listener shall be idle.
+        If the handler throws an exception, it will be suppressed and logged.
+        """
+        assert self.handler is not None and self.idle
+        self.push_count += 1
         try:
-            self.queue.put_nowait((message, transfer))
-            self.push_count += 1
-        except asyncio.QueueFull:
-            self.overrun_count += 1
+            await self.handler(message, transfer)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            owner = self._owner() if self._owner is not None else None
+            _logger.exception('%s got an unhandled exception in the message handler: %s',
+                              owner if owner is not None else self, ex)
+
+    def _pop_nowait(self) -> typing.Optional[typing.Tuple[MessageClass, pyuavcan.transport.TransferFrom]]:
+        if not self._length:
+            return None
+        head = self._head
+        message, transfer = self._messages[head], self._transfers[head]
+        self._messages[head] = None     # Do not keep references to the objects the user may no longer need.
+        self._transfers[head] = None
+        self._head = (head + 1) % len(self._messages)
+        self._length -= 1
+        if not self._length and len(self._messages) > _INITIAL_QUEUE_SIZE:
+            self._shrink()
+        assert message is not None and transfer is not None
+        return message, transfer
+
+    def _wake_waiters(self) -> None:
+        for waiter in self._waiters:
+            _wake_waiter(waiter)
+
+    def _grow(self) -> None:
+        assert self._length == len(self._messages), 'Only a full ring buffer can be grown'
+        size = self._length * 2 if self.capacity is None else min(self._length * 2, self.capacity)
+        head = self._head
+        self._messages = self._messages[head:] + self._messages[:head] + [None] * (size - self._length)
+        self._transfers = self._transfers[head:] + self._transfers[:head] + [None] * (size - self._length)
+        self._head = 0
+
+    def _shrink(self) -> None:
+        """
+        Halves the ring buffer, but not below the initial size, so that a burst does not retain the memory
+        indefinitely. The ring is shrunk gradually to avoid reallocating it back and forth under recurring bursts.
+        """
+        assert not self._length, 'Only an empty ring buffer can be shrunk'
+        size = max(len(self._messages) // 2, _INITIAL_QUEUE_SIZE)
+        self._messages = [None] * size
+        self._transfers = [None] * size
+        self._head = 0
+
+    def __repr__(self) -> str:
+        return pyuavcan.util.repr_attributes_noexcept(self,
+                                                      capacity=self.capacity,
+                                                      queue_length=self._length,
+                                                      push_count=self.push_count,
+                                                      overrun_count=self.overrun_count,
+                                                      exception=self.exception,
+                                                      handler=self.handler,
+                                                      busy=self.busy,
+                                                      closed=self.closed)
+
+
+def _wake_waiter(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
 
 
 class SubscriberImpl(Closable, typing.Generic[MessageClass]):
@@ -272,20 +525,54 @@ class SubscriberImpl(Closable, typing.Generic[MessageClass]):
         self.deserialization_failure_count = 0
         self._finalizer = finalizer
         self._loop = loop
+        # The executor is created on first use. There is one worker only in order to preserve the message ordering.
+        self._maybe_executor: typing.Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._may_offload_deserialization = \
+            pyuavcan.dsdl.get_max_serialized_representation_size_bytes(dtype) > _OFFLOADED_DESERIALIZATION_THRESHOLD
         self._task = loop.create_task(self._task_function())
-        self._listeners: typing.List[_Listener[MessageClass]] = []
+        self._listeners: typing.Set[_Listener[MessageClass]] = set()    # The order does not matter.
+        self._sole_listener: typing.Optional[_Listener[MessageClass]] = None  # Set iff there is exactly one listener.
         self._closed = False
 
     async def _task_function(self) -> None:
         exception: typing.Optional[Exception] = None
+        # Hold down local references to everything that is accessed per message to avoid repeated attribute lookups.
+        # The listener collection is never replaced, only mutated, so it is safe to keep a reference to it.
+        dtype = self.dtype
+        deserialize = pyuavcan.dsdl.deserialize
+        receive_until = self.transport_session.receive_until
+        time = self._loop.time
+        listeners = self._listeners
         try:
             while not self._closed:
-                transfer = await self.transport_session.receive_until(self._loop.time() + _RECEIVE_TIMEOUT)
+                # Closure of this instance is signaled by cancelling the task, so there is no need to wait for it here;
+                # the timeout only defines how quickly the closure of the underlying transport is detected.
+                # The deadline shall be refreshed per call: if it were in the past, the session would read the queued
+                # transfers without context switching, starving other tasks while there is a backlog.
+                transfer = await receive_until(time() + _RECEIVE_TIMEOUT)
                 if transfer is not None:
-                    message = pyuavcan.dsdl.deserialize(self.dtype, transfer.fragmented_payload)
+                    message: typing.Optional[MessageClass]
+                    if self._may_offload_deserialization \
+                            and sum(map(len, transfer.fragmented_payload)) > _OFFLOADED_DESERIALIZATION_THRESHOLD:
+                        message = await self._loop.run_in_executor(self._get_executor(),
+                                                                   deserialize,
+                                                                   dtype,
+                                                                   transfer.fragmented_payload)
+                    else:
+                        message = deserialize(dtype, transfer.fragmented_payload)
                     if message is not None:
-                        for rx in self._listeners:
-                            rx.push(message, transfer)
+                        # The listeners do not check the types, so this is the only place where they are validated.
+                        assert isinstance(message, dtype), 'Internal protocol violation'
+                        assert isinstance(transfer, pyuavcan.transport.TransferFrom), 'Internal protocol violation'
+                        rx = self._sole_listener
+                        if rx is not None:      # This is the most common case, so it is specialized.
+                            if rx.handler is not None and rx.idle:
+                                await rx.handle(message, transfer)
+                            else:
+                                rx.push(message, transfer)
+                        else:
+                            for rx in listeners:
+                                rx.push(message, transfer)
                     else:
                         self.deserialization_failure_count += 1
         except asyncio.CancelledError:
@@ -297,6 +584,8 @@ class SubscriberImpl(Closable, typing.Generic[MessageClass]):
 
         try:
             self._closed = True
+            if self._maybe_executor is not None:
+                self._maybe_executor.shutdown(wait=False)
             self._finalizer([self.transport_session])
         except Exception as ex:
             exception = ex
@@ -306,6 +595,7 @@ class SubscriberImpl(Closable, typing.Generic[MessageClass]):
         exception = exception if exception is not None else PortClosedError(repr(self))
         for rx in self._listeners:
             rx.exception = exception
+            rx.close()
 
     def close(self) -> None:
         self._closed = True
@@ -316,14 +606,16 @@ class SubscriberImpl(Closable, typing.Generic[MessageClass]):
 
     def add_listener(self, rx: _Listener[MessageClass]) -> None:
         self._raise_if_closed()
-        self._listeners.append(rx)
+        self._listeners.add(rx)
+        self._update_sole_listener()
 
     def remove_listener(self, rx: _Listener[MessageClass]) -> None:
         # Removal is always possible, even if closed.
         try:
             self._listeners.remove(rx)
-        except ValueError:
+        except KeyError:
             _logger.exception('%r does not have listener %r', self, rx)
+        self._update_sole_listener()
         if len(self._listeners) == 0 and not self._closed:
             self._closed = True
             try:
@@ -331,6 +623,14 @@ class SubscriberImpl(Closable, typing.Generic[MessageClass]):
             except Exception as ex:
                 _logger.debug('Listener removal: could not cancel the task %r: %s', self._task, ex, exc_info=True)
 
+    def _update_sole_listener(self) -> None:
+        self._sole_listener = next(iter(self._listeners)) if len(self._listeners) == 1 else None
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        if self._maybe_executor is None:
+            self._maybe_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        return self._maybe_executor
+
     def _raise_if_closed(self) -> None:
         if self._closed:
             raise PortClosedError(repr(self))
@@ -342,3 +642,100 @@ class SubscriberImpl(Closable, typing.Generic[MessageClass]):
                                                       deserialization_failure_count=self.deserialization_failure_count,
                                                       listeners=self._listeners,
                                                       closed=self._closed)
+
+
+def _unittest_listener() -> None:
+    from pyuavcan.transport import TransferFrom, Timestamp, Priority
+
+    loop = asyncio.get_event_loop()
+    run = loop.run_until_complete
+
+    def tf(transfer_id: int) -> TransferFrom:
+        return TransferFrom(timestamp=Timestamp(0, 0),
+                            priority=Priority.NOMINAL,
+                            transfer_id=transfer_id,
+                            fragmented_payload=[],
+                            source_node_id=None)
+
+    rx: _Listener[typing.Any] = _Listener(3, loop)
+    assert run(rx.pop(0)) is None
+    for i in range(4):
+        rx.push(i, tf(i))   # The message type is not checked by the listener.
+    assert rx.push_count == 3
+    assert rx.overrun_count == 1
+    assert run(rx.pop(-1)) == (0, tf(0))
+    rx.push(10, tf(10))     # Wraps around.
+    assert [run(rx.pop(1.0)) for _ in range(3)] == [(1, tf(1)), (2, tf(2)), (10, tf(10))]
+    assert run(rx.pop(0)) is None
+
+    rx = _Listener(None, loop)
+    for i in range(_INITIAL_QUEUE_SIZE * 3):
+        rx.push(i, tf(i))   # Unlimited capacity, the ring buffer is grown as necessary.
+    assert rx.overrun_count == 0
+    assert [run(rx.pop(0)) for _ in range(_INITIAL_QUEUE_SIZE * 3)] == \
+        [(i, tf(i)) for i in range(_INITIAL_QUEUE_SIZE * 3)]
+
+    assert rx.drain() == ([], [])
+    rx.push(0, tf(0))
+    rx.push(1, tf(1))
+    assert run(rx.pop(0)) == (0, tf(0))     # Move the head forward so that the ring buffer wraps around.
+    size = len(rx._messages)
+    for i in range(2, size + 1):
+        rx.push(i, tf(i))
+    assert len(rx._messages) == size and rx._head + rx._length > size
+    assert rx.drain() == (list(range(1, size + 1)), [tf(i) for i in range(1, size + 1)])
+    assert all(x is None for x in rx._messages + rx._transfers)
+    assert rx.drain() == ([], [])
+    assert run(rx.pop(0)) is None
+
+    # The drained slots are cleared; the ring is shrunk gradually after a burst.
+    for i in range(_INITIAL_QUEUE_SIZE * 8):
+        rx.push(i, tf(i))
+    assert len(rx._messages) == _INITIAL_QUEUE_SIZE * 8
+    assert rx.drain() == (list(range(_INITIAL_QUEUE_SIZE * 8)), [tf(i) for i in range(_INITIAL_QUEUE_SIZE * 8)])
+    assert len(rx._messages) == _INITIAL_QUEUE_SIZE * 8   # The ring was utilized well, so it is kept.
+    assert all(x is None for x in rx._messages + rx._transfers)
+    for size in (_INITIAL_QUEUE_SIZE * 4, _INITIAL_QUEUE_SIZE * 2, _INITIAL_QUEUE_SIZE, _INITIAL_QUEUE_SIZE):
+        rx.push(0, tf(0))
+        assert rx.drain() == ([0], [tf(0)])
+        assert len(rx._messages) == size
+    for i in range(_INITIAL_QUEUE_SIZE * 2):
+        rx.push(i, tf(i))
+    assert [run(rx.pop(0)) for _ in range(_INITIAL_QUEUE_SIZE * 2)] == \
+        [(i, tf(i)) for i in range(_INITIAL_QUEUE_SIZE * 2)]
+    assert len(rx._messages) == _INITIAL_QUEUE_SIZE
+
+    # The messages taken out of the queue are returned to its head; the capacity limit drops the newest ones.
+    rx = _Listener(3, loop)
+    for i in range(3):
+        rx.push(i, tf(i))
+    messages, transfers = rx.drain()
+    rx.push(3, tf(3))
+    rx.push(4, tf(4))
+    rx.unshift(messages[1:], transfers[1:])
+    assert rx.push_count == 4 and rx.overrun_count == 1
+    assert rx.drain() == ([1, 2, 3], [tf(1), tf(2), tf(3)])
+    rx.unshift([], [])
+    assert rx.drain() == ([], [])
+
+    rx = _Listener(None, loop)
+    started_at = loop.time()
+    assert run(rx.pop(0.1)) is None
+    assert loop.time() - started_at >= 0.09   # Allow for the clock resolution.
+
+    loop.call_later(0.1, rx.push, 123, tf(123))
+    assert run(rx.pop(None)) == (123, tf(123))
+    # Concurrent consumers.
+    pending = [loop.create_task(rx.pop(None)), loop.create_task(rx.pop(10.0))]
+    run(asyncio.sleep(0.1))
+    rx.push(456, tf(456))
+    run(asyncio.sleep(0.1))
+    assert [t.result() for t in pending if t.done()] == [(456, tf(456))]
+    pending = [t for t in pending if not t.done()]
+    assert len(pending) == 1
+
+    # Closing unblocks all pending consumers and the subsequent calls do not block.
+    loop.call_later(0.1, rx.close)
+    assert run(rx.pop(None)) is None
+    assert pending[0].done() and pending[0].result() is None
+    assert run(rx.pop(10.0)) is None
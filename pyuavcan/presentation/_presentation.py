@@ -151,7 +151,10 @@ class Presentation:
         this. If the user is not reading the received messages quickly enough and the size of the queue is limited
         (technically, it is always limited at least by the amount of the available memory),
         the queue may become full in which case newer messages will be dropped and the overrun counter
-        will be incremented once per dropped message.
+        will be incremented once per dropped message. Sustained overruns are reported via the log
+        at exponentially growing intervals (upon the 1st, 2nd, 4th, 8th, etc. lost message).
+        The queue may be bypassed if the messages are handled in the background by the only subscriber for the
+        subject, in which case the capacity has no effect; see :meth:`Subscriber.receive_in_background`.
 
         See :class:`Subscriber` for further information about subscribers.
         """
@@ -0,0 +1,26 @@
+#
+# Copyright (c) 2019 UAVCAN Development Team
+# This software is distributed under the terms of the MIT License.
+# Author: Pavel Kirienko <pavel.kirienko@zubax.com>
+#
+
+import sys
+import types
+import typing
+import logging
+import pyuavcan
+
+
+def _unittest_use_uvloop(monkeypatch: typing.Any, caplog: typing.Any) -> None:
+    # The import fails as if the package was not installed.
+    monkeypatch.setitem(sys.modules, 'uvloop', None)
+    with caplog.at_level(logging.WARNING, logger='pyuavcan'):
+        assert not pyuavcan.use_uvloop()
+    assert any(r.levelno == logging.WARNING and 'uvloop' in r.getMessage() for r in caplog.records)
+
+    # The stub does not affect the event loop policy, unlike the real package.
+    install_calls: typing.List[None] = []
+    stub = types.SimpleNamespace(install=lambda: install_calls.append(None), __version__='0.0.0')
+    monkeypatch.setitem(sys.modules, 'uvloop', stub)
+    assert pyuavcan.use_uvloop()
+    assert len(install_calls) == 1
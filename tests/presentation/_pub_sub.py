@@ -165,7 +165,17 @@ async def _unittest_slow_presentation_pub_sub(generated_packages: typing.List[py
     rx = await sub_heart.receive_for(_RX_TIMEOUT)
     assert rx is None
 
+    async def iterate_until_closed() -> None:
+        async for _ in sub_heart:
+            pass
+
+    rx_task = asyncio.ensure_future(sub_heart.receive())
+    iter_task = asyncio.ensure_future(iterate_until_closed())
+    await asyncio.sleep(0.1)
     sub_heart.close()
+    with pytest.raises(pyuavcan.presentation.PortClosedError):
+        await asyncio.wait_for(rx_task, 0.1)  # Closing unblocks all pending receive calls immediately.
+    await asyncio.wait_for(iter_task, 0.1)
     sub_heart.close()       # Shall not raise.
 
     record_handler_output: typing.List[typing.Tuple[uavcan.diagnostic.Record_1_0, pyuavcan.transport.TransferFrom]] = []
@@ -218,10 +228,16 @@ async def _unittest_slow_presentation_pub_sub(generated_packages: typing.List[py
     assert stat.deserialization_failures == 1
     assert stat.messages == 1
 
+    # Now the background handler is the only listener left, so it will be invoked directly bypassing the queue.
+    sub_record.close()
+    await pub_record.publish(record)
+    await asyncio.sleep(0.1)
+    assert len(record_handler_output) == 2
+    assert sub_record2.sample_statistics().messages == 2
+
     # Close the objects explicitly and ensure that they are finalized. This also removes the warnings that some tasks
     # have been removed while pending.
     pub_heart.close()
-    sub_record.close()
     sub_record2.close()
     pub_record.close()
     await asyncio.sleep(1.1)
@@ -237,8 +253,159 @@ async def _unittest_slow_presentation_pub_sub(generated_packages: typing.List[py
     assert list(pres_a.transport.output_sessions) == []
     assert list(pres_b.transport.output_sessions) == []
 
-    assert len(record_handler_output) == 1
+    assert len(record_handler_output) == 2
     assert repr(record_handler_output[0][0]) == repr(record)
     assert record_handler_output[0][1].source_node_id == 42
     assert record_handler_output[0][1].transfer_id == 0
     assert record_handler_output[0][1].priority == Priority.NOMINAL
+    assert repr(record_handler_output[1][0]) == repr(record)
+    assert record_handler_output[1][1].transfer_id == 1
+
+
+@pytest.mark.asyncio  # type: ignore
+async def _unittest_slow_presentation_pub_sub_handler_ordering(
+        generated_packages: typing.List[pyuavcan.dsdl.GeneratedPackageInfo],
+        caplog:             typing.Any) -> None:
+    assert generated_packages
+    import uavcan.node
+    from pyuavcan.transport.loopback import LoopbackTransport
+
+    pres = pyuavcan.presentation.Presentation(LoopbackTransport(1234))
+    pub = pres.make_publisher_with_fixed_subject_id(uavcan.node.Heartbeat_1_0)
+    sub_a = pres.make_subscriber_with_fixed_subject_id(uavcan.node.Heartbeat_1_0)
+    sub_b = pres.make_subscriber_with_fixed_subject_id(uavcan.node.Heartbeat_1_0)
+
+    handled: typing.List[int] = []
+    active_handlers = 0
+
+    async def handler(message: uavcan.node.Heartbeat_1_0, _transfer: pyuavcan.transport.TransferFrom) -> None:
+        nonlocal active_handlers
+        active_handlers += 1
+        assert active_handlers == 1, 'The handler shall never be invoked concurrently'
+        await asyncio.sleep(0.1)    # A slow handler, the messages are queued meanwhile.
+        handled.append(message.uptime)
+        active_handlers -= 1
+
+    sub_a.receive_in_background(handler)
+    for i in range(3):
+        await pub.publish(uavcan.node.Heartbeat_1_0(uptime=i))
+    await asyncio.sleep(0.05)
+
+    # The subscriber becomes the sole one while its handler is still busy with the queued messages.
+    # The queue shall not be bypassed until the backlog is processed; otherwise, the ordering would be broken.
+    sub_b.close()
+    await pub.publish(uavcan.node.Heartbeat_1_0(uptime=3))
+    await asyncio.sleep(1.0)
+    assert handled == [0, 1, 2, 3]
+
+    # The backlog is processed, so the queue is bypassed from now on.
+    await pub.publish(uavcan.node.Heartbeat_1_0(uptime=4))
+    await asyncio.sleep(0.5)
+    assert handled == [0, 1, 2, 3, 4]
+    assert sub_a.sample_statistics().messages == 5
+    assert sub_a.sample_statistics().overruns == 0
+
+    # The failures of the handler invoked directly are attributed to the subscriber, like those of the queued one.
+    async def failing_handler(_message: uavcan.node.Heartbeat_1_0, _transfer: pyuavcan.transport.TransferFrom) -> None:
+        raise RuntimeError('Intended failure')
+
+    sub_a.receive_in_background(failing_handler)
+    caplog.clear()
+    await pub.publish(uavcan.node.Heartbeat_1_0(uptime=5))
+    await asyncio.sleep(0.5)
+    failures = [r.getMessage() for r in caplog.records if 'Intended failure' in r.getMessage()]
+    assert len(failures) == 1
+    assert failures[0].startswith(repr(sub_a))
+
+    pub.close()
+    sub_a.close()
+    await asyncio.sleep(1.1)
+    pres.close()
+
+
+# noinspection PyProtectedMember
+@pytest.mark.asyncio  # type: ignore
+async def _unittest_slow_presentation_pub_sub_offloaded_deserialization(
+        generated_packages: typing.List[pyuavcan.dsdl.GeneratedPackageInfo],
+        monkeypatch:        typing.Any) -> None:
+    assert generated_packages
+    import uavcan.diagnostic
+    from pyuavcan.transport.loopback import LoopbackTransport
+    from pyuavcan.presentation._port import _subscriber
+
+    # None of the standard types is large enough, so the threshold is lowered such that only longer texts exceed it.
+    monkeypatch.setattr(_subscriber, '_OFFLOADED_DESERIALIZATION_THRESHOLD', 20)
+
+    pres = pyuavcan.presentation.Presentation(LoopbackTransport(1234))
+    pub = pres.make_publisher_with_fixed_subject_id(uavcan.diagnostic.Record_1_0)
+    sub = pres.make_subscriber_with_fixed_subject_id(uavcan.diagnostic.Record_1_0)
+    impl = sub._impl
+    assert impl._may_offload_deserialization
+    assert impl._maybe_executor is None     # Created lazily.
+
+    # Short and long messages are interleaved to ensure that the offloading does not break the ordering.
+    texts = [('Offloaded message #%d' if i % 2 else 'Inline #%d') % i for i in range(10)]
+    for t in texts:
+        await pub.publish(uavcan.diagnostic.Record_1_0(text=t))
+    received: typing.List[str] = []
+    for _ in texts:
+        rx = await sub.receive_for(_RX_TIMEOUT)
+        assert rx is not None
+        received.append(rx[0].text.tobytes().decode())
+    assert received == texts
+    assert sub.sample_statistics().deserialization_failures == 0
+
+    executor = impl._maybe_executor
+    assert executor is not None
+
+    # The executor is shut down together with the implementation.
+    pub.close()
+    sub.close()
+    await asyncio.sleep(1.1)
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+    pres.close()
+
+
+@pytest.mark.asyncio  # type: ignore
+async def _unittest_slow_presentation_pub_sub_handler_replacement(
+        generated_packages: typing.List[pyuavcan.dsdl.GeneratedPackageInfo]) -> None:
+    assert generated_packages
+    import uavcan.node
+    from pyuavcan.transport.loopback import LoopbackTransport
+
+    pres = pyuavcan.presentation.Presentation(LoopbackTransport(1234))
+    pub = pres.make_publisher_with_fixed_subject_id(uavcan.node.Heartbeat_1_0)
+    sub_a = pres.make_subscriber_with_fixed_subject_id(uavcan.node.Heartbeat_1_0)
+    sub_b = pres.make_subscriber_with_fixed_subject_id(uavcan.node.Heartbeat_1_0)   # Keeps the queue in use.
+
+    handled_first: typing.List[int] = []
+    handled_second: typing.List[int] = []
+
+    async def first(message: uavcan.node.Heartbeat_1_0, _transfer: pyuavcan.transport.TransferFrom) -> None:
+        handled_first.append(message.uptime)
+        await asyncio.sleep(0.1)
+
+    async def second(message: uavcan.node.Heartbeat_1_0, _transfer: pyuavcan.transport.TransferFrom) -> None:
+        handled_second.append(message.uptime)
+
+    # The messages are queued before the handler is configured, so they are taken out of the queue in one batch.
+    for i in range(6):
+        await pub.publish(uavcan.node.Heartbeat_1_0(uptime=i))
+    await asyncio.sleep(0.1)
+    sub_a.receive_in_background(first)
+    await asyncio.sleep(0.05)
+
+    # The handler is replaced while the first one is busy with the batch; the rest of the batch shall not be lost.
+    assert handled_first == [0]
+    sub_a.receive_in_background(second)
+    await asyncio.sleep(0.5)
+    assert handled_first == [0]
+    assert handled_second == [1, 2, 3, 4, 5]
+    assert sub_a.sample_statistics().messages == 6
+
+    pub.close()
+    sub_a.close()
+    sub_b.close()
+    await asyncio.sleep(1.1)
+    pres.close()